@@ -46,6 +46,9 @@ pygments_style = 'sphinx'
 
 autosummary_generate = True
 
+# optional dependencies that are not installed to build the documentation
+autodoc_mock_imports = ['serial_asyncio']
+
 # The master toctree document.
 master_doc = 'index'
 
@@ -0,0 +1,28 @@
+# Serial port shared by the examples
+# The port is opened once per process and reused by every example run from the same interpreter, so batch runs
+#   do not pay the cost of opening the serial interface again
+
+from functools import lru_cache
+import serial
+
+SERIAL_PORT_TIMEOUT = 1  # seconds, only reached when the device does not answer
+
+# serial configuration expected by the Xcom-485i, built once for every port opened
+_SERIAL_KW = dict(parity=serial.PARITY_EVEN, timeout=SERIAL_PORT_TIMEOUT,
+                  write_timeout=SERIAL_PORT_TIMEOUT,  # never block forever on a stalled driver
+                  rtscts=False, dsrdtr=False, xonxoff=False)  # the Xcom-485i uses no flow control
+
+
+@lru_cache(maxsize=None)
+def _open_port(name, baudrate):
+    return serial.Serial(name, baudrate, **_SERIAL_KW)
+
+
+def get_port(name, baudrate):
+    """
+    Get the serial port configured for the Xcom-485i, opened on first use and reopened if it has been closed
+    """
+    serial_port = _open_port(name, baudrate)
+    if not serial_port.is_open:
+        serial_port.open()
+    return serial_port
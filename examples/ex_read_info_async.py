@@ -0,0 +1,34 @@
+# Read user info 3001, Battery temperature, (Modbus register 2) from all Xtenders with asyncio
+# Run this example within the 'examples/' folder using 'python ex_read_info_async.py' from a CLI after installing
+#   xcom485i package with 'pip install xcom485i[async]'
+
+import sys
+import asyncio
+import serial
+from xcom485i.async_client import AsyncXcom485i
+
+SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
+SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
+DIP_SWITCHES_ADDRESS_OFFSET = 0  # your modbus address offset as set inside the Xcom485i device
+
+
+async def scan_all_xtenders(xcom485i):
+    return await asyncio.gather(*(xcom485i.read_info(getattr(xcom485i.addresses, 'xt_%d_device_id' % index), 2)
+                                  for index in range(1, 10)))
+
+
+async def main():
+    try:
+        xcom485i = await AsyncXcom485i.open(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE, DIP_SWITCHES_ADDRESS_OFFSET)
+    except serial.serialutil.SerialException as e:
+        print("Check your serial configuration : ", e)
+        sys.exit(1)
+
+    read_values = await scan_all_xtenders(xcom485i)
+    for index, read_value in enumerate(read_values, 1):
+        print('xt_%d read_value:' % index, read_value)  # None for a missing Xtender
+    xcom485i.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
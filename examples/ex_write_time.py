@@ -2,8 +2,10 @@
 # Run this example within the 'examples/' folder using 'python ex_write_time.py' from a CLI after installing
 #   xcom485i package with 'pip install xcom485i'
 
+import sys
 import serial
 from xcom485i.client import Xcom485i
+from _port import get_port
 from datetime import datetime
 
 SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
@@ -12,15 +14,19 @@ DIP_SWITCHES_ADDRESS_OFFSET = 0  # your modbus address offset as set inside the
 
 if __name__ == "__main__":
     try:
-        serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE, parity=serial.PARITY_EVEN, timeout=1)
+        serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
     except serial.serialutil.SerialException as e:
         print("Check your serial configuration : ", e)
-    else:
-        xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
+        sys.exit(1)
 
-        # current date and time
-        current_dt = datetime.now()
-        print(current_dt)
-        echo = xcom485i.write_time(xcom485i.addresses.system_device_id, current_dt)
-        assert echo == 8  # a value of 2 is expected on write action, represent the number of registers written
-        print('echo:', echo)
+    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+
+    # current date and time
+    current_dt = datetime.now()
+    print(current_dt)
+    registers = xcom485i.encode_datetime(current_dt)  # may be prepared once and written several times
+    echo = xcom485i.write_time_raw(xcom485i.addresses.system_device_id, registers)
+    if echo != 8:  # a value of 8 is expected on write action, represent the number of registers written
+        print('Write failed, echo:', echo)
+        sys.exit(1)
+    print('echo:', echo)
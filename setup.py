@@ -1,10 +1,46 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import sys, os
+import importlib.util
 import setuptools
+from setuptools.command.build_py import build_py
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 current_directory = os.path.abspath(os.path.dirname(__file__))
 
+
+class BuildPyWithAddresses(build_py):
+    """
+    Generate a module with precomputed addresses for each dip-switches offset
+    """
+
+    def run(self):
+        super().run()
+        spec = importlib.util.spec_from_file_location(
+            'xcom485i_addresses', os.path.join(current_directory, 'xcom485i', 'addresses.py'))
+        addresses = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(addresses)
+        for offset in addresses.DIP_SWITCHES_OFFSETS:
+            target = os.path.join(self.build_lib, 'xcom485i', '_addresses_offset_%d.py' % offset)
+            self.announce('generating %s' % target, 2)
+            if not self.dry_run:
+                with open(target, 'w', encoding='utf-8') as f:
+                    f.write('# Generated by setup.py, addresses for a dip-switches offset of %d\n\n' % offset)
+                    f.write('from xcom485i.addresses import Addresses\n\n')
+                    f.write('ADDRESSES = Addresses._make(%r)\n' % (tuple(addresses.Addresses(offset)),))
+
+
+# the optional C framing extension, the package falls back to pure Python when it is not built
+if cythonize is not None:
+    ext_modules = cythonize([setuptools.Extension('xcom485i._xcomfast', ['xcom485i/_xcomfast.pyx'], optional=True)],
+                            language_level=3)
+else:
+    ext_modules = []
+
 with open(os.path.join(current_directory, 'README.rst'), encoding='utf-8') as f:
     long_description = f.read()
 
@@ -28,6 +64,8 @@ setuptools.setup(
         "Source Code": "https://github.com/studer-innotec/xcom485i",
     },
     packages=setuptools.find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={'build_py': BuildPyWithAddresses},
     include_package_data=True,
     license='MIT',
     classifiers=[
@@ -41,6 +79,7 @@ setuptools.setup(
     ],
     python_requires='>=3.6.8',
     install_requires=['uModbus==1.0.3', 'pyserial>=3.4'],
+    extras_require={'crc': ['crcmod>=1.7'], 'async': ['pyserial-asyncio>=0.6']},
     # these are optional and override conf.py settings
     command_options={
         'build_sphinx': {
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CRC-16 used to frame the *Modbus RTU* messages.
+
+When the optional `xcom485i._xcomfast` extension has been built, or else when the optional *crcmod* package is
+installed, their C implementation is used. Otherwise a table driven pure Python implementation is used, which avoids
+the per byte exception handling of the one shipped with *uModbus*. Install *crcmod* with `pip install xcom485i[crc]`.
+"""
+
+import struct
+from umodbus.client.serial import redundancy_check, rtu
+
+try:
+    from xcom485i import _xcomfast
+except ImportError:
+    _xcomfast = None
+
+try:
+    import crcmod
+except ImportError:
+    crcmod = None
+
+
+def _make_table(poly=0xA001):
+    """
+    Build the 256 entries look up table of the reflected CRC-16/MODBUS polynomial
+    """
+    table = []
+    for index in range(256):
+        crc = index
+        for _ in range(8):
+            crc = (crc >> 1) ^ poly if crc & 0x0001 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_TABLE = _make_table()
+
+
+if _xcomfast is not None:
+    crc16 = _xcomfast.crc16
+elif crcmod is not None:
+    crc16 = crcmod.mkCrcFun(0x18005, initCrc=0xFFFF, rev=True, xorOut=0x0000)
+else:
+    def crc16(msg, table=_TABLE):
+        """
+        Return the CRC of a message as an integer
+        """
+        crc = 0xFFFF
+        for byte in msg:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        return crc
+
+
+def get_crc(msg):
+    """
+    Return the CRC of a message as 2 bytes, little-endian
+    """
+    return struct.pack('<H', crc16(msg))
+
+
+def install():
+    """
+    Make *uModbus* use `get_crc` to build and validate the RTU frames
+    """
+    redundancy_check.get_crc = get_crc
+    rtu.get_crc = get_crc
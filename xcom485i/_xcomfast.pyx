@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+Optional C implementation of the *Modbus RTU* framing used on each request.
+
+It is built by `setup.py` when *Cython* is available, `xcom485i._crc` and `xcom485i.client` fall back to their pure
+Python implementation otherwise.
+"""
+
+from libc.stdint cimport uint16_t
+
+
+cdef uint16_t _TABLE[256]
+
+
+cdef void _make_table(uint16_t poly=0xA001):
+    """
+    Build the 256 entries look up table of the reflected CRC-16/MODBUS polynomial
+    """
+    cdef uint16_t crc
+    cdef int index, bit
+    for index in range(256):
+        crc = index
+        for bit in range(8):
+            crc = (crc >> 1) ^ poly if crc & 0x0001 else crc >> 1
+        _TABLE[index] = crc
+
+
+_make_table()
+
+
+cdef inline uint16_t _crc16(const unsigned char *msg, Py_ssize_t size) nogil:
+    cdef uint16_t crc = 0xFFFF
+    cdef Py_ssize_t index
+    for index in range(size):
+        crc = (crc >> 8) ^ _TABLE[(crc ^ msg[index]) & 0xFF]
+    return crc
+
+
+cpdef unsigned int crc16(const unsigned char[:] msg):
+    """
+    Return the CRC of a message as an integer
+    """
+    if msg.shape[0] == 0:
+        return 0xFFFF
+    return _crc16(&msg[0], msg.shape[0])
+
+
+cpdef bytes build_read(unsigned char slave_id, unsigned char function_code, uint16_t address, uint16_t quantity):
+    """
+    Return the request ADU reading `quantity` registers from `address` with the holding (3) or input (4) registers
+    function code
+    """
+    cdef unsigned char adu[8]
+    cdef uint16_t crc
+    adu[0] = slave_id
+    adu[1] = function_code
+    adu[2] = address >> 8
+    adu[3] = address & 0xFF
+    adu[4] = quantity >> 8
+    adu[5] = quantity & 0xFF
+    crc = _crc16(adu, 6)
+    adu[6] = crc & 0xFF
+    adu[7] = crc >> 8
+    return adu[:8]
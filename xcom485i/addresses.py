@@ -11,11 +11,36 @@ Please read the complete documentation available on : `Studer Innotec SA <https:
 !!! DO NOT CHANGE CONFIGURATIONS BELOW !!!
 """
 
+from collections import namedtuple
+from functools import lru_cache
+from importlib import import_module
 
-class Addresses:
+# offsets selectable with the dip-switches, a module with precomputed addresses is generated for each at build time
+DIP_SWITCHES_OFFSETS = (0, 32, 64, 128)
+
+# (attribute name, address relative to the dip-switches offset)
+_FIELDS = (('dip_switches_offset', 0),
+           ('gateway_device_id', 1),
+           ('system_device_id', 2),
+           ('xt_l1_group_device_id', 7),
+           ('xt_l2_group_device_id', 8),
+           ('xt_l3_group_device_id', 9),
+           ('xt_group_device_id', 10)) \
+    + tuple(('xt_%d_device_id' % index, 10 + index) for index in range(1, 10)) \
+    + (('vt_group_device_id', 20),) \
+    + tuple(('vt_%d_device_id' % index, 20 + index) for index in range(1, 16)) \
+    + (('vs_group_device_id', 40),) \
+    + tuple(('vs_%d_device_id' % index, 40 + index) for index in range(1, 16)) \
+    + (('bsp_group_device_id', 60),
+       ('bsp_device_id', 61))
+
+
+class Addresses(namedtuple('Addresses', [name for name, _ in _FIELDS])):
     """
     This class stores all accessible addresses from the Xcom485i device
 
+    Addresses are computed once from the dip-switches offset and stored as an immutable tuple
+
     Attributes
     ----------
     dip_switches_offset
@@ -56,64 +81,57 @@ class Addresses:
         Offset to write a parameter into ram only
     """
 
-    def __init__(self, offset):
-        self.dip_switches_offset = offset
-        self.gateway_device_id = self.dip_switches_offset + 1
-        self.system_device_id = self.dip_switches_offset + 2
-
-        self.xt_l1_group_device_id = self.dip_switches_offset + 7
-        self.xt_l2_group_device_id = self.dip_switches_offset + 8
-        self.xt_l3_group_device_id = self.dip_switches_offset + 9
-        self.xt_group_device_id = self.dip_switches_offset + 10
-        self.xt_1_device_id = self.xt_group_device_id + 1
-        self.xt_2_device_id = self.xt_group_device_id + 2
-        self.xt_3_device_id = self.xt_group_device_id + 3
-        self.xt_4_device_id = self.xt_group_device_id + 4
-        self.xt_5_device_id = self.xt_group_device_id + 5
-        self.xt_6_device_id = self.xt_group_device_id + 6
-        self.xt_7_device_id = self.xt_group_device_id + 7
-        self.xt_8_device_id = self.xt_group_device_id + 8
-        self.xt_9_device_id = self.xt_group_device_id + 9
-
-        self.vt_group_device_id = self.dip_switches_offset + 20
-        self.vt_1_device_id = self.vt_group_device_id + 1
-        self.vt_2_device_id = self.vt_group_device_id + 2
-        self.vt_3_device_id = self.vt_group_device_id + 3
-        self.vt_4_device_id = self.vt_group_device_id + 4
-        self.vt_5_device_id = self.vt_group_device_id + 5
-        self.vt_6_device_id = self.vt_group_device_id + 6
-        self.vt_7_device_id = self.vt_group_device_id + 7
-        self.vt_8_device_id = self.vt_group_device_id + 8
-        self.vt_9_device_id = self.vt_group_device_id + 9
-        self.vt_10_device_id = self.vt_group_device_id + 10
-        self.vt_11_device_id = self.vt_group_device_id + 11
-        self.vt_12_device_id = self.vt_group_device_id + 12
-        self.vt_13_device_id = self.vt_group_device_id + 13
-        self.vt_14_device_id = self.vt_group_device_id + 14
-        self.vt_15_device_id = self.vt_group_device_id + 15
-
-        self.vs_group_device_id = self.dip_switches_offset + 40
-        self.vs_1_device_id = self.vs_group_device_id + 1
-        self.vs_2_device_id = self.vs_group_device_id + 2
-        self.vs_3_device_id = self.vs_group_device_id + 3
-        self.vs_4_device_id = self.vs_group_device_id + 4
-        self.vs_5_device_id = self.vs_group_device_id + 5
-        self.vs_6_device_id = self.vs_group_device_id + 6
-        self.vs_7_device_id = self.vs_group_device_id + 7
-        self.vs_8_device_id = self.vs_group_device_id + 8
-        self.vs_9_device_id = self.vs_group_device_id + 9
-        self.vs_10_device_id = self.vs_group_device_id + 10
-        self.vs_11_device_id = self.vs_group_device_id + 11
-        self.vs_12_device_id = self.vs_group_device_id + 12
-        self.vs_13_device_id = self.vs_group_device_id + 13
-        self.vs_14_device_id = self.vs_group_device_id + 14
-        self.vs_15_device_id = self.vs_group_device_id + 15
-
-        self.bsp_group_device_id = self.dip_switches_offset + 60
-        self.bsp_device_id = self.bsp_group_device_id + 1
-
-        self.read_param_flash_offset = 0
-        self.read_param_min_offset = 2000
-        self.read_param_max_offset = 4000
-        self.write_param_flash_ram = 0
-        self.write_param_ram_only = 6000
+    __slots__ = ()
+
+    read_param_flash_offset = 0
+    read_param_min_offset = 2000
+    read_param_max_offset = 4000
+    write_param_flash_ram = 0
+    write_param_ram_only = 6000
+
+    def __new__(cls, offset):
+        return super().__new__(cls, *[offset + value for _, value in _FIELDS])
+
+    def __getnewargs__(self):
+        # copy and pickle rebuild the instance from its offset, not from all its fields
+        return (self.dip_switches_offset,)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__slots__' not in cls.__dict__:
+            raise TypeError("%s must define __slots__, addresses are stored without any instance __dict__"
+                            % cls.__name__)
+
+
+@lru_cache(maxsize=16)
+def get_addresses(offset):
+    """
+    Get the addresses matching a dip-switches offset, instances are shared between calls with the same offset
+
+    Addresses generated at build time are used when available, otherwise they are computed
+
+    Parameters
+    ----------
+    offset
+        The address offset as defined with the dip-switches
+
+    Returns
+    -------
+    Addresses
+        Addresses accessible from the Xcom-485i
+
+    Examples
+    --------
+    Addresses can be copied and pickled, they are rebuilt from their offset
+
+    >>> import copy, pickle
+    >>> addresses = get_addresses(32)
+    >>> copy.copy(addresses) == copy.deepcopy(addresses) == pickle.loads(pickle.dumps(addresses)) == addresses
+    True
+    >>> pickle.loads(pickle.dumps(addresses)).gateway_device_id
+    33
+    """
+    try:
+        return import_module('xcom485i._addresses_offset_%d' % offset).ADDRESSES
+    except ImportError:
+        return Addresses(offset)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Warnings
+--------
+This module requires the optional *pyserial-asyncio* package, install it with `pip install xcom485i[async]`.
+
+*Modbus RTU* allows a single pending request on the bus, requests are therefore still sent one at a time. Using
+*asyncio* lets the caller run other tasks, like decoding or storing values, while a request is on the wire.
+"""
+
+import asyncio
+import logging
+from time import monotonic
+import serial
+import serial_asyncio
+from umodbus.client.serial import rtu
+from umodbus.client.serial.redundancy_check import CRCError
+from umodbus.exceptions import ModbusError
+from umodbus.functions import expected_response_pdu_size_from_request_pdu
+from xcom485i.addresses import get_addresses
+from xcom485i.client import EXCEPTION_ADU_SIZE, _check_crc, _parse_float
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncXcom485i:
+    """
+    This class act as an asynchronous *Modbus* master in order to communicate with the *Xcom-485i* gateway (slave)
+
+    Attributes
+    ----------
+    addresses: xcom485i.addresses.Addresses
+        Instance of Addresses class grouping all the ones accessible from the Xcom-485i
+    timeout: float
+        Duration in seconds to wait for each part of a response
+    """
+
+    def __init__(self, reader, writer, offset=0, baudrate=9600, timeout=1):
+        """
+        Use `AsyncXcom485i.open` to open the serial port with the configuration expected by the *Xcom-485i*.
+
+        Parameters
+        ----------
+        reader
+            asyncio.StreamReader of the serial port
+        writer
+            asyncio.StreamWriter of the serial port
+        offset
+            The address offset as defined with the dip-switches
+        baudrate
+            Baudrate of the serial port, used to compute the *Modbus RTU* silent interval
+        timeout
+            Duration in seconds to wait for each part of a response
+        """
+        self.reader = reader
+        self.writer = writer
+        self.addresses = get_addresses(offset)
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+        # 3.5 characters of 11 bits, fixed to 1.75 ms above 19200 bps
+        self._silent_interval = max(3.5 * 11 / baudrate, 0.00175)
+        self._character_time = 11 / baudrate
+        self._last_frame_time = 0.0
+
+    @classmethod
+    async def open(cls, url, baudrate, offset=0, timeout=1):
+        """
+        Open a serial port configured for the *Xcom-485i* and create a client using it.
+
+        Parameters
+        ----------
+        url
+            Serial port interface name, for example *'COM4'* or *'/dev/ttyUSB0'*
+        baudrate
+            Baudrate used by the serial port interface
+        offset
+            The address offset as defined with the dip-switches
+        timeout
+            Duration in seconds to wait for each part of a response
+
+        Returns
+        -------
+        AsyncXcom485i
+            Client using the opened serial port
+        """
+        reader, writer = await serial_asyncio.open_serial_connection(url=url, baudrate=baudrate,
+                                                                     parity=serial.PARITY_EVEN)
+        return cls(reader, writer, offset, baudrate, timeout)
+
+    def close(self):
+        """
+        Close the serial port
+
+        Returns
+        -------
+        None
+        """
+        self.writer.close()
+
+    async def _discard_input(self, timeout):
+        """
+        Drop the bytes received until the line has been silent for `timeout` seconds, like the late response of a
+        request that timed out, a *StreamReader* cannot be flushed otherwise
+        """
+        try:
+            while True:
+                dropped = await asyncio.wait_for(self.reader.read(256), timeout)
+                if not dropped:  # end of stream
+                    return
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("<- Discard data : 0x%s", dropped.hex())
+        except asyncio.TimeoutError:
+            pass
+
+    async def _send_recv(self, message):
+        """
+        Send a request ADU once the bus has been silent long enough and return the raw response ADU, requests of
+        concurrent tasks are sent one after the other
+        """
+        expected_size = expected_response_pdu_size_from_request_pdu(message[1:-2]) + 3
+        async with self._lock:
+            # the line must stay silent for at least one character, even when the silent interval already elapsed
+            await self._discard_input(max(self._silent_interval - (monotonic() - self._last_frame_time),
+                                          self._character_time))
+            try:
+                self.writer.write(message)
+                response = await asyncio.wait_for(self.reader.readexactly(EXCEPTION_ADU_SIZE), self.timeout)
+                if response[1] & 0x80:
+                    _check_crc(response)
+                    if response[0] != message[0]:
+                        raise ValueError("response 0x%s does not match the request" % response.hex())
+                    rtu.raise_for_exception_adu(response)
+                response += await asyncio.wait_for(
+                    self.reader.readexactly(expected_size - EXCEPTION_ADU_SIZE), self.timeout)
+                _check_crc(response)
+                return response
+            finally:
+                self._last_frame_time = monotonic()
+
+    async def _read_float(self, message):
+        """
+        Send a request reading 2 registers and return them as a float
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("-> Transmit ADU : 0x%s", bytes(message).hex())
+        try:
+            response = await self._send_recv(message)
+            if response[:2] != message[:2]:
+                raise ValueError("response 0x%s does not match the request" % response.hex())
+        except asyncio.TimeoutError:
+            logger.error("--> No response received within %s seconds", self.timeout)
+        except (ValueError, KeyError) as e:
+            logger.error(
+                "--> Please match your configurations and the values set with the dip-switches on the device: %s", e)
+        except CRCError as e:
+            logger.error("--> Corrupted response, please check the wiring and the line termination : %s", e)
+        except ModbusError as e:
+            logger.error("--> Modbus error : %s", e)
+        else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("<- Receive ADU : 0x%s", response.hex())
+            return _parse_float(response)
+
+    async def read_parameter(self, slave_id, address):
+        """
+        Read a parameter from a targeted device as a float, see `xcom485i.client.Xcom485i.read_parameter`.
+
+        Parameters
+        ----------
+        slave_id: int
+            Slave identifier number (targeted device)
+        address: int
+            Register starting address, offset included
+
+        Returns
+        -------
+        float
+            parameter read
+        """
+        return await self._read_float(rtu.read_holding_registers(slave_id=slave_id, starting_address=address,
+                                                                 quantity=2))
+
+    async def read_info(self, slave_id, address):
+        """
+        Read a user info from a targeted device as a float, see `xcom485i.client.Xcom485i.read_info`.
+
+        Parameters
+        ----------
+        slave_id
+            Slave identifier number (targeted device)
+        address
+            Register starting address, see *Studer Modbus RTU Appendix* for the complete list of accessible
+            register per device
+
+        Returns
+        -------
+        float
+            User info read
+
+        Example
+        --------
+        .. code-block:: python
+
+            # Read user info 3001, Battery temperature, (Modbus register 2) from all Xtenders with asyncio
+            # Run this example within the 'examples/' folder using 'python ex_read_info_async.py' from a CLI after
+            #   installing xcom485i package with 'pip install xcom485i[async]'
+
+            import sys
+            import asyncio
+            import serial
+            from xcom485i.async_client import AsyncXcom485i
+
+            SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
+            SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
+            DIP_SWITCHES_ADDRESS_OFFSET = 0  # your modbus address offset as set inside the Xcom485i device
+
+
+            async def scan_all_xtenders(xcom485i):
+                return await asyncio.gather(*(xcom485i.read_info(getattr(xcom485i.addresses, 'xt_%d_device_id' % index), 2)
+                                              for index in range(1, 10)))
+
+
+            async def main():
+                try:
+                    xcom485i = await AsyncXcom485i.open(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE, DIP_SWITCHES_ADDRESS_OFFSET)
+                except serial.serialutil.SerialException as e:
+                    print("Check your serial configuration : ", e)
+                    sys.exit(1)
+
+                read_values = await scan_all_xtenders(xcom485i)
+                for index, read_value in enumerate(read_values, 1):
+                    print('xt_%d read_value:' % index, read_value)  # None for a missing Xtender
+                xcom485i.close()
+
+
+            if __name__ == "__main__":
+                asyncio.run(main())
+        """
+        return await self._read_float(rtu.read_input_registers(slave_id=slave_id, starting_address=address,
+                                                               quantity=2))
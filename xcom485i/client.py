@@ -16,15 +16,118 @@ To allow the cyclic write of parameters without count limit, we suggest you to w
 parameters in RAM only
 """
 
-from struct import pack, unpack
+from struct import Struct, unpack_from
 from datetime import datetime
+from time import monotonic, sleep
 from umodbus.client.serial import rtu
+from umodbus.client.serial.redundancy_check import CRCError
+from umodbus.functions import expected_response_pdu_size_from_request_pdu, READ_HOLDING_REGISTERS, \
+    READ_INPUT_REGISTERS
+from umodbus.utils import recv_exactly
 from umodbus.exceptions import *
-from xcom485i.addresses import Addresses
+from xcom485i.addresses import get_addresses
+from xcom485i import _crc
 import logging
 
 logger = logging.getLogger(__name__)
 
+_crc.install()
+
+# a Modbus read is limited to 125 registers, 4 registers per message
+MAX_MESSAGES_PER_READ = 31
+# a Modbus read is limited to 125 registers, 2 registers per float
+MAX_FLOATS_PER_READ = 62
+# a Modbus write is limited to 123 registers, 2 registers per float
+MAX_FLOATS_PER_WRITE = 61
+
+# an exception response is the shortest one
+EXCEPTION_ADU_SIZE = 5
+# exception responses of a gateway refusing a read longer than a single message
+_REFUSED_ERRORS = (IllegalDataAddressError, IllegalDataValueError)
+
+_F32 = Struct('>f')
+_HH = Struct('>HH')
+_H = Struct('>H')
+_4H = Struct('>4H')
+_5H = Struct('>5H')
+_TIME8 = Struct('>8H')
+_READ_PDU = Struct('>BBHH')
+
+try:
+    from xcom485i._xcomfast import build_read as _build_read_adu
+except ImportError:
+    def _build_read_adu(slave_id, function_code, address, quantity):
+        """
+        Return the request ADU reading `quantity` registers from `address` with the holding (3) or input (4)
+        registers function code
+        """
+        message = _READ_PDU.pack(slave_id, function_code, address, quantity)
+        return message + _crc.get_crc(message)
+
+
+def _build_read(slave_id, function_code, address, quantity):
+    """
+    Check the fields of a read request, so that the same ValueError is raised whether the `xcom485i._xcomfast`
+    extension is built or not, and return its ADU
+    """
+    if not 0 <= slave_id <= 0xFF:
+        raise ValueError('Slave id must be a value between 0 and 255.')
+    if not 0 <= address <= 0xFFFF:
+        raise ValueError('Starting address must be a value between 0 and 65535.')
+    if not 1 <= quantity <= 0x007D:
+        raise ValueError('Quantity field of request must be a value between 1 and 125.')
+    return _build_read_adu(slave_id, function_code, address, quantity)
+
+
+def _float_runs(addresses, max_count):
+    """
+    Group sorted float addresses into [starting address, float count] runs of consecutive floats
+    """
+    runs = []
+    for address in addresses:
+        if runs and address == runs[-1][0] + 2 * runs[-1][1] and runs[-1][1] < max_count:
+            runs[-1][1] += 1
+        else:
+            runs.append([address, 1])
+    return runs
+
+
+def _check_crc(adu, _crc16=_crc.crc16):
+    """
+    Raise a CRCError when the CRC ending an ADU does not match its content
+    """
+    if _crc16(adu[:-2]) != adu[-2] | adu[-1] << 8:
+        raise CRCError('CRC validation failed for 0x%s' % adu.hex())
+
+
+def _parse_float(response):
+    """
+    Return the float held by the 2 registers of a read response ADU
+    """
+    return _F32.unpack_from(response, 3)[0]
+
+
+def _parse_messages(response):
+    """
+    Return the 4 registers blocks of a messages read response ADU, up to the first all-zero block padding the
+    response when the gateway holds fewer messages than requested
+    """
+    registers = unpack_from('>%dH' % (response[2] // 2), response, 3)
+    messages = []
+    for index in range(0, len(registers), 4):
+        message = list(registers[index:index + 4])
+        if not any(message):
+            break
+        messages.append(message)
+    return messages
+
+
+def _parse_quantity(response):
+    """
+    Return the quantity of registers echoed by a write multiple registers response ADU
+    """
+    return _H.unpack_from(response, 4)[0]
+
 
 class Xcom485i:
     """
@@ -38,7 +141,7 @@ class Xcom485i:
         Instance of Addresses class grouping all the ones accessible from the Xcom-485i
     """
 
-    def __init__(self, serial_port, offset=0, debug=False):
+    def __init__(self, serial_port, offset=0, debug=False, cache_ttl_s=None):
         """
         serial device must be configured with :\n
         - EVEN parity\n
@@ -47,30 +150,148 @@ class Xcom485i:
         - 1 parity bit (Even)\n
         - 1 stop bit\n
         - timeout 1 second\n
+        Responses are read by their expected length, so the timeout only delays a request the device does not
+        answer. The next request is sent as soon as the silent interval of 3.5 characters required by *Modbus RTU*
+        has elapsed after the previous response, the interval is computed from the baudrate of the serial port
+        when the client is created.
+
         Parameters
         ----------
         serial_port
-            Instance of serial module
+            Instance of serial module, it stays open for the whole lifetime of the client and is only closed by
+            `Xcom485i.close` or when leaving a `with` block
         offset
             The address offset as defined with the dip-switches
         debug: boolean
-            Activate debug traces for tx/rx frames
+            Activate debug traces for tx/rx frames by setting the level of the `xcom485i.client` logger, they are
+            printed on stderr by a handler added to this logger only when neither it nor the root logger has a handler
+        cache_ttl_s: float
+            Duration in seconds during which a parameter value read from flash is served from cache, disabled when
+            None. When set, minimum and maximum values are also cached, without expiry since they never change
         """
         self.serial_port = serial_port
-        if debug is True:
-            logging.basicConfig(level=logging.DEBUG)
-        self.addresses = Addresses(offset)
-
-    def __del__(self):
+        if debug:
+            logger.setLevel(logging.DEBUG)
+            # the traces go to the handlers of the application when it configured logging, so they are printed once
+            if not logger.handlers and not logging.getLogger().hasHandlers():
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(levelname)s %(message)s'))
+                logger.addHandler(handler)
+        self.addresses = get_addresses(offset)
+        self.cache_ttl_s = cache_ttl_s
+        self._bulk_messages_supported = True
+        # groups whose members have the unicast addresses following the multicast one, with their maximum size
+        self._group_sizes = {self.addresses.xt_group_device_id: 9,
+                             self.addresses.vt_group_device_id: 15,
+                             self.addresses.vs_group_device_id: 15,
+                             self.addresses.bsp_group_device_id: 1}
+        self._limits_cache = {}
+        self._values_cache = {}
+        # 3.5 characters of 11 bits, fixed to 1.75 ms above 19200 bps
+        self._silent_interval = max(3.5 * 11 / getattr(serial_port, 'baudrate', 9600), 0.00175)
+        self._last_frame_time = 0.0
+        # gateway requests polled in loops, built once
+        self._pending_count_adu = _build_read(self.addresses.gateway_device_id, READ_INPUT_REGISTERS, 0, 1)
+        self._message_registers_adu = _build_read(self.addresses.gateway_device_id, READ_INPUT_REGISTERS, 1, 4)
+        self._drain_adu = _build_read(self.addresses.gateway_device_id, READ_INPUT_REGISTERS, 0, 5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
         """
-        Explicit destructor
-        Ensure to close serial device
+        Close the serial port, also done when leaving a `with` block using this client
+
         Returns
         -------
         None
         """
         self.serial_port.close()
 
+    # the globals used on each request are bound as default arguments, so that they are looked up as locals
+    def _send_recv(self, message, expected_size=None, _monotonic=monotonic, _sleep=sleep, _recv_exactly=recv_exactly,
+                   _check_crc=_check_crc):
+        """
+        Send a request ADU once the bus has been silent long enough and return the raw response ADU, read by its
+        expected size so that no timeout is waited for
+        """
+        if expected_size is None:
+            expected_size = expected_response_pdu_size_from_request_pdu(message[1:-2]) + 3
+        port = self.serial_port
+        silence = self._silent_interval - (_monotonic() - self._last_frame_time)
+        if silence > 0:
+            _sleep(silence)
+        try:
+            # drop the tail of a previous response or line noise, it would be read as the start of this response
+            port.reset_input_buffer()
+            port.write(message)
+            port.flush()
+            response = _recv_exactly(port.read, EXCEPTION_ADU_SIZE)
+            if response[1] & 0x80:
+                _check_crc(response)
+                if response[0] != message[0]:
+                    raise ValueError("response 0x%s does not match the request" % response.hex())
+                rtu.raise_for_exception_adu(response)
+            response += _recv_exactly(port.read, expected_size - EXCEPTION_ADU_SIZE)
+            _check_crc(response)
+            return response
+        finally:
+            self._last_frame_time = _monotonic()
+
+    def _execute(self, message, parser, expected_size=None, reraise=()):
+        """
+        Send a request ADU and return its response ADU converted by `parser`, errors are logged and None is returned
+        except for the `reraise` exceptions
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("-> Transmit ADU : 0x%s", bytes(message).hex())
+        try:
+            response = self._send_recv(message, expected_size)
+            if response[:2] != message[:2]:
+                raise ValueError("response 0x%s does not match the request" % response.hex())
+        except reraise:
+            raise
+        except (ValueError, KeyError) as e:
+            logger.error(
+                "--> Please match your configurations and the values set with the dip-switches on the device: %s", e)
+        except CRCError as e:
+            logger.error("--> Corrupted response, please check the wiring and the line termination : %s", e)
+        except ModbusError as e:
+            logger.error("--> Modbus error : %s", e)
+        else:
+            if debug:
+                logger.debug("<- Receive ADU : 0x%s", response.hex())
+            return parser(response)
+
+    def _execute_bulk(self, message, parser, expected_size=None):
+        """
+        Send a read request longer than a single message, like `Xcom485i._execute`, when the gateway refuses it with an
+        exception response the bulk reads are disabled for the lifetime of this instance and False is returned
+        """
+        try:
+            return self._execute(message, parser, expected_size, _REFUSED_ERRORS)
+        except _REFUSED_ERRORS as e:
+            logger.warning("--> Longer reads refused by the gateway, messages are now read one by one : %s", e)
+            self._bulk_messages_supported = False
+            return False
+
+    def _read_prepared(self, message, registers):
+        """
+        Send a prebuilt read request and unpack the registers of its response with the `registers` Struct
+        """
+        return self._execute(message, lambda response: registers.unpack_from(response, 3), 5 + registers.size)
+
+    def invalidate_cache(self):
+        """
+        Forget all cached parameter values, including minimum and maximum values
+        """
+        self._limits_cache.clear()
+        self._values_cache.clear()
+
     def read_parameter(self, slave_id, address):
         """
         Read a parameter from a targeted device as a float.
@@ -85,6 +306,9 @@ class Xcom485i:
         - read min allowed value  : offset is 2000 (READ_PARAM_MIN_OFFSET)\n
         - read max allowed value  : offset is 4000 (READ_PARAM_MAX_OFFSET)\n
 
+        When `cache_ttl_s` is set, minimum and maximum values are cached after their first read and values from
+        flash are cached during `cache_ttl_s`, every read is sent to the device otherwise.
+
         Parameters
         ----------
         slave_id: int
@@ -98,6 +322,82 @@ class Xcom485i:
         float
             parameter read
 
+        See also
+        --------
+        Xcom485i.read_parameter_bundle
+        """
+        message = _build_read(slave_id, READ_HOLDING_REGISTERS, address, 2)
+        if self.cache_ttl_s is None:
+            return self._execute(message, _parse_float)
+        key = (slave_id, address)
+        is_limit = self.addresses.read_param_min_offset <= address < self.addresses.write_param_ram_only
+        if is_limit:
+            if key in self._limits_cache:
+                return self._limits_cache[key]
+        elif key in self._values_cache:
+            value, read_time = self._values_cache[key]
+            if monotonic() - read_time < self.cache_ttl_s:
+                return value
+        float_response = self._execute(message, _parse_float)
+        if float_response is not None:
+            if is_limit:
+                self._limits_cache[key] = float_response
+            else:
+                self._values_cache[key] = (float_response, monotonic())
+            return float_response
+
+    def read_parameters(self, slave_id, addresses):
+        """
+        Read several parameters from a targeted device as floats.
+
+        Note
+        -----
+        Parameters stored at consecutive addresses are read together, up to `MAX_FLOATS_PER_READ` parameters per
+        request, so reading a block of parameters costs a single round-trip instead of one per parameter.
+
+        Parameters
+        ----------
+        slave_id: int
+            Slave identifier number (targeted device)
+        addresses: iterable
+            Registers starting addresses, offset included, see `Xcom485i.read_parameter`
+
+        Returns
+        -------
+        dict
+            Parameter read for each address, None when its request failed
+
+        Example
+        --------
+        .. code-block:: python
+
+            # read parameters 1107 and 1108 (Modbus registers 14 and 16) from the first Xtender in one request
+            read_values = xcom485i.read_parameters(xcom485i.addresses.xt_1_device_id, [14, 16])
+        """
+        return self._read_floats(READ_HOLDING_REGISTERS, slave_id, addresses)
+
+    def read_parameter_bundle(self, slave_id, address):
+        """
+        Read the actual value of a parameter from flash together with its minimum and maximum values.
+
+        Note
+        -----
+        The flash, minimum and maximum values are 2000 registers apart, far above the 125 registers a single
+        *Modbus* request can span, so three requests are still sent back to back.
+
+        Parameters
+        ----------
+        slave_id: int
+            Slave identifier number (targeted device)
+        address: int
+            Register starting address without any offset, see Studer Modbus RTU Appendix for the complete list of
+            accessible register per device
+
+        Returns
+        -------
+        tuple
+            (value, minimum value, maximum value), each item is None if its read failed
+
         Example
         --------
         .. code-block:: python
@@ -106,8 +406,10 @@ class Xcom485i:
             # Run this example within the 'examples/' folder using 'python ex_read_param.py' from a CLI
             #   after installing xcom485i package with 'pip install xcom485i'
 
+            import sys
             import serial
             from xcom485i.client import Xcom485i
+            from _port import get_port
 
             SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
             SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
@@ -115,44 +417,23 @@ class Xcom485i:
 
             if __name__ == "__main__":
                 try:
-                    serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE,
-                                                parity=serial.PARITY_EVEN, timeout=1)
+                    serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
                 except serial.serialutil.SerialException as e:
                     print("Check your serial configuration : ", e)
-                else:
-                    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
-
-                    # read actual value stored into flash memory
-                    read_value = xcom485i.read_parameter(xcom485i.addresses.xt_1_device_id,
-                                                         14 + xcom485i.addresses.read_param_flash_offset)
-                    print('read_value:', read_value)
-
-                    # read minimum value of this parameter
-                    read_value = xcom485i.read_parameter(xcom485i.addresses.xt_1_device_id,
-                                                         14 + xcom485i.addresses.read_param_min_offset)
-                    assert read_value == 2.0  # only for 1107 parameter
-                    print('read_min_value:', read_value)
-
-                    # read maximum value of this parameter
-                    read_value = xcom485i.read_parameter(xcom485i.addresses.xt_1_device_id,
-                                                         14 + xcom485i.addresses.read_param_max_offset)
-                    assert read_value == 50.0  # only for 1107 parameter
-                    print('read_max_value:', read_value)
-        """
-        message = rtu.read_holding_registers(slave_id=slave_id, starting_address=address, quantity=2)
-        logger.debug("-> Transmit ADU : 0x%s", str(bytes(message).hex()))
-        try:
-            response = rtu.send_message(message, self.serial_port)
-        except (ValueError, KeyError) as e:
-            logger.error(
-                "--> Please match your configurations and the values set with the dip-switches on the device: ", e)
-        except ModbusError as e:
-            logger.error("--> Modbus error : ", e)
-        else:
-            ba = pack('>HH', response[0], response[1])
-            float_response = unpack('>f', ba)[0]
-            logger.debug("<- Receive data : 0x%s", str(ba.hex()))
-            return float_response
+                    sys.exit(1)
+
+                xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+
+                # read actual, minimum and maximum values of this parameter
+                read_value, read_min_value, read_max_value = xcom485i.read_parameter_bundle(
+                    xcom485i.addresses.xt_1_device_id, 14)
+                print('read_value:', read_value)
+                print('read_min_value:', read_min_value)  # 2.0 for 1107 parameter
+                print('read_max_value:', read_max_value)  # 50.0 for 1107 parameter
+        """
+        return (self.read_parameter(slave_id, address + self.addresses.read_param_flash_offset),
+                self.read_parameter(slave_id, address + self.addresses.read_param_min_offset),
+                self.read_parameter(slave_id, address + self.addresses.read_param_max_offset))
 
     def read_time(self, slave_id):
         """
@@ -190,8 +471,10 @@ class Xcom485i:
             # Run this example within the 'examples/' folder using 'python ex_read_time.py' from a CLI after installing
             #   xcom485i package with 'pip install xcom485i'
 
+            import sys
             import serial
             from xcom485i.client import Xcom485i
+            from _port import get_port
 
             SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
             SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
@@ -199,28 +482,25 @@ class Xcom485i:
 
             if __name__ == "__main__":
                 try:
-                    serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE, parity=serial.PARITY_EVEN, timeout=1)
+                    serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
                 except serial.serialutil.SerialException as e:
                     print("Check your serial configuration : ", e)
-                else:
-                    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
+                    sys.exit(1)
 
-                    # read actual value stored into flash memory
-                    read_value = xcom485i.read_time(xcom485i.addresses.system_device_id)
-                    print('Read time:', read_value)
+                xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+
+                # read actual value stored into flash memory
+                read_value = xcom485i.read_time(xcom485i.addresses.system_device_id)
+                print('Read time:', read_value)
         """
-        message = rtu.read_holding_registers(slave_id=slave_id, starting_address=0, quantity=8)
-        logger.debug("-> Transmit ADU : 0x%s", str(bytes(message).hex()))
-        try:
-            response = rtu.send_message(message, self.serial_port)
-        except (ValueError, KeyError) as e:
-            logger.error(
-                "--> Please match your configurations and the values set with the dip-switches on the device: ", e)
-        except ModbusError as e:
-            logger.error("--> Modbus error : ", e)
-        else:
-            return datetime(response[7], response[6], response[5], response[3], response[2], response[1], response[0]*1000)
-            
+        message = _build_read(slave_id, READ_HOLDING_REGISTERS, 0, 8)
+        response = self._read_prepared(message, _TIME8)
+        if response is not None:
+            millisecond, second, minute, hour, _, day, month, year = response
+            if year < 100:  # format 2022 = 22
+                year += 2000
+            return datetime(year, month, day, hour, minute, second, millisecond * 1000)
+
     def write_parameter(self, slave_id, address, value):
         """
          Write a parameter value into a targeted device.
@@ -258,8 +538,10 @@ class Xcom485i:
             # Run this example within the 'examples/' folder using 'python ex_write_param.py' from a CLI
             #   after installing xcom485i package with 'pip install xcom485i'
 
+            import sys
             import serial
             from xcom485i.client import Xcom485i
+            from _port import get_port
 
             SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
             SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
@@ -267,34 +549,70 @@ class Xcom485i:
 
             if __name__ == "__main__":
                 try:
-                    serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE,
-                                                parity=serial.PARITY_EVEN, timeout=1)
+                    serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
                 except serial.serialutil.SerialException as e:
                     print("Check your serial configuration : ", e)
-                else:
-                    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
-
-                    value = 8  # 8 [A]
-                    echo = xcom485i.write_parameter(xcom485i.addresses.xt_1_device_id,
-                                                    14 + xcom485i.addresses.write_param_ram_only, value)
-                    # a value of 2 is expected on write action, represent the number of registers written
-                    assert echo == 2
-                    print('echo:', echo)
-        """
-        ba = pack('>f', value)
-        registers = unpack('>HH', ba)
+                    sys.exit(1)
+
+                xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+
+                value = 8  # 8 [A]
+                echo = xcom485i.write_parameter(xcom485i.addresses.xt_1_device_id,
+                                                14 + xcom485i.addresses.write_param_ram_only, value)
+                # a value of 2 is expected on write action, represent the number of registers written
+                if echo != 2:
+                    print('Write failed, echo:', echo)
+                    sys.exit(1)
+                print('echo:', echo)
+        """
+        registers = _HH.unpack(_F32.pack(value))
         message = rtu.write_multiple_registers(slave_id=slave_id, starting_address=address, values=registers)
-        logger.debug("-> Transmit ADU : 0x%s", str(bytes(message).hex()))
-        try:
-            response = rtu.send_message(message, self.serial_port)
-        except (ValueError, KeyError) as e:
-            logger.error(
-                "--> Please match your configurations and the values set with the dip-switches on the device: ", e)
-        except ModbusError as e:
-            logger.error("--> Modbus error : ", e)
-        else:
-            logger.debug("<- Receive data : 0x%s", str(response))
-            return response
+        response = self._execute(message, _parse_quantity)
+        if response is not None:
+            self._values_cache.clear()
+        return response
+
+    def write_parameters(self, slave_id, pairs):
+        """
+        Write several parameter values into a targeted device.
+
+        Note
+        -----
+        Parameters stored at consecutive addresses are written together, up to `MAX_FLOATS_PER_WRITE` parameters
+        per request, so configuring a block of parameters costs a single round-trip instead of one per parameter.
+
+        Parameters
+        ----------
+        slave_id: int
+            Slave identifier number (targeted device)
+        pairs: dict or iterable
+            Values to write by register starting address, offset included, see `Xcom485i.write_parameter`
+
+        Returns
+        -------
+        dict
+            True for each address whose write was acknowledged, False when its request failed
+
+        Example
+        --------
+        .. code-block:: python
+
+            # write parameters 1107 and 1108 (Modbus registers 14 and 16) in RAM only into the first Xtender
+            #   in one request
+            ram_only = xcom485i.addresses.write_param_ram_only
+            written = xcom485i.write_parameters(xcom485i.addresses.xt_1_device_id,
+                                                {14 + ram_only: 8, 16 + ram_only: 8})
+        """
+        values = dict(pairs)
+        written = dict.fromkeys(values, False)
+        for address, count in _float_runs(sorted(values), MAX_FLOATS_PER_WRITE):
+            run = range(address, address + 2 * count, 2)
+            registers = unpack_from('>%dH' % (2 * count), b''.join(_F32.pack(values[a]) for a in run))
+            message = rtu.write_multiple_registers(slave_id=slave_id, starting_address=address, values=registers)
+            if self._execute(message, _parse_quantity) == 2 * count:
+                written.update(dict.fromkeys(run, True))
+                self._values_cache.clear()
+        return written
 
     def write_time(self, slave_id, value):
         """
@@ -325,6 +643,61 @@ class Xcom485i:
         int
             Quantity of written registers (must be 8)
 
+        See also
+        --------
+        Xcom485i.write_time_raw
+        """
+        return self.write_time_raw(slave_id, self.encode_datetime(value))
+
+    @staticmethod
+    def encode_datetime(value):
+        """
+        Convert a datetime into the time registers expected by `Xcom485i.write_time_raw`.
+
+        Note
+        -----
+        The weekday register is filled with `datetime.weekday`, 0 for Monday. The *Studer Modbus RTU Appendix* does
+        not state that the device derives it from the date, so it is always written.
+
+        Parameters
+        ----------
+        value
+            The datetime to convert
+
+        Returns
+        -------
+        tuple
+            Content of the time registers 0 to 7
+        """
+        return (value.microsecond // 1000,
+                value.second,
+                value.minute,
+                value.hour,
+                value.weekday(),
+                value.day,
+                value.month,
+                value.year)
+
+    def write_time_raw(self, slave_id, registers):
+        """
+        Write the time of a targeted installation from already encoded time registers.
+
+        Note
+        -----
+        The registers can be built once with `Xcom485i.encode_datetime` and written to several installations.
+
+        Parameters
+        ----------
+        slave_id
+            Slave identifier number (targeted device)
+        registers
+            Content of the time registers 0 to 7, see `Xcom485i.write_time`
+
+        Returns
+        -------
+        int
+            Quantity of written registers (must be 8)
+
         Example
         --------
         .. code-block:: python
@@ -333,8 +706,10 @@ class Xcom485i:
             # Run this example within the 'examples/' folder using 'python ex_write_time.py' from a CLI after installing
             #   xcom485i package with 'pip install xcom485i'
 
+            import sys
             import serial
             from xcom485i.client import Xcom485i
+            from _port import get_port
             from datetime import datetime
 
             SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
@@ -343,39 +718,25 @@ class Xcom485i:
 
             if __name__ == "__main__":
                 try:
-                    serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE, parity=serial.PARITY_EVEN, timeout=1)
+                    serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
                 except serial.serialutil.SerialException as e:
                     print("Check your serial configuration : ", e)
-                else:
-                    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
-
-                    # current date and time
-                    current_dt = datetime.now()
-                    print(current_dt)
-                    echo = xcom485i.write_time(xcom485i.addresses.system_device_id, current_dt)
-                    assert echo == 8  # a value of 2 is expected on write action, represent the number of registers written
-                    print('echo:', echo)
-        """
-        registers = [int(value.microsecond / 1000),
-                        value.second,
-                        value.minute,
-                        value.hour,
-                        value.weekday(),
-                        value.day,
-                        value.month,
-                        value.year]
+                    sys.exit(1)
+
+                xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+
+                # current date and time
+                current_dt = datetime.now()
+                print(current_dt)
+                registers = xcom485i.encode_datetime(current_dt)  # may be prepared once and written several times
+                echo = xcom485i.write_time_raw(xcom485i.addresses.system_device_id, registers)
+                if echo != 8:  # a value of 8 is expected on write action, represent the number of registers written
+                    print('Write failed, echo:', echo)
+                    sys.exit(1)
+                print('echo:', echo)
+        """
         message = rtu.write_multiple_registers(slave_id=slave_id, starting_address=0, values=registers)
-        logger.debug("-> Transmit ADU : 0x%s", str(bytes(message).hex()))
-        try:
-            response = rtu.send_message(message, self.serial_port)
-        except (ValueError, KeyError) as e:
-            logger.error(
-                "--> Please match your configurations and the values set with the dip-switches on the device: ", e)
-        except ModbusError as e:
-            logger.error("--> Modbus error : ", e)
-        else:
-            logger.debug("<- Receive data : 0x%s", str(response))
-            return response
+        return self._execute(message, _parse_quantity)
 
     def read_info(self, slave_id, address):
         """
@@ -408,8 +769,10 @@ class Xcom485i:
             # Run this example within the 'examples/' folder using 'python ex_read_info.py' from a CLI
             #   after installing xcom485i package with 'pip install xcom485i'
 
+            import sys
             import serial
             from xcom485i.client import Xcom485i
+            from _port import get_port
 
             SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
             SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
@@ -417,29 +780,152 @@ class Xcom485i:
 
             if __name__ == "__main__":
                 try:
-                    serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE,
-                                                parity=serial.PARITY_EVEN, timeout=1)
+                    serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
                 except serial.serialutil.SerialException as e:
                     print("Check your serial configuration : ", e)
-                else:
-                    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
-                    read_value = xcom485i.read_info(xcom485i.addresses.xt_1_device_id, 2)
-                    print('read_value:', read_value)
+                    sys.exit(1)
+
+                xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+                read_value = xcom485i.read_info(xcom485i.addresses.xt_1_device_id, 2)
+                print('read_value:', read_value)
         """
-        message = rtu.read_input_registers(slave_id=slave_id, starting_address=address, quantity=2)
-        logger.debug("-> Transmit ADU : 0x%s", str(bytes(message).hex()))
-        try:
-            response = rtu.send_message(message, self.serial_port)
-        except (ValueError, KeyError) as e:
-            logger.error(
-                "--> Please match your configurations and the values set with the dip-switches on the device: ", e)
-        except ModbusError as e:
-            logger.error("--> Modbus error : ", e)
-        else:
-            ba = pack('>HH', response[0], response[1])
-            float_response = unpack('>f', ba)[0]
-            logger.debug("<- Receive data : 0x%s", str(ba.hex()))
-            return float_response
+        return self.send_prepared(self.prepare_read_info(slave_id, address))
+
+    def read_infos(self, slave_id, addresses):
+        """
+        Read several user infos from a targeted device as floats.
+
+        Note
+        -----
+        User infos stored at consecutive addresses are read together, up to `MAX_FLOATS_PER_READ` user infos per
+        request, so reading a block of user infos costs a single round-trip instead of one per user info.
+
+        Parameters
+        ----------
+        slave_id
+            Slave identifier number (targeted device)
+        addresses
+            Registers starting addresses, see *Studer Modbus RTU Appendix* for the complete list of accessible
+            register per device
+
+        Returns
+        -------
+        dict
+            User info read for each address, None when its request failed
+
+        Example
+        --------
+        .. code-block:: python
+
+            # read user infos 3000 to 3004 (Modbus registers 0 to 8) from the first Xtender in one request
+            read_values = xcom485i.read_infos(xcom485i.addresses.xt_1_device_id, range(0, 10, 2))
+        """
+        return self._read_floats(READ_INPUT_REGISTERS, slave_id, addresses)
+
+    @staticmethod
+    def prepare_read_info(slave_id, address):
+        """
+        Build once the request reading a user info, to be sent as many times as needed with
+        `Xcom485i.send_prepared`.
+
+        Parameters
+        ----------
+        slave_id
+            Slave identifier number (targeted device)
+        address
+            Register starting address, see *Studer Modbus RTU Appendix* for the complete list of accessible
+            register per device
+
+        Returns
+        -------
+        bytes
+            Request ADU, CRC included
+
+        Example
+        --------
+        .. code-block:: python
+
+            # poll the battery temperature of the first Xtender without building the request each time
+            message = xcom485i.prepare_read_info(xcom485i.addresses.xt_1_device_id, 2)
+            while True:
+                read_value = xcom485i.send_prepared(message)
+        """
+        return _build_read(slave_id, READ_INPUT_REGISTERS, address, 2)
+
+    def send_prepared(self, message):
+        """
+        Send a request built with `Xcom485i.prepare_read_info` and read the user info as a float.
+
+        Parameters
+        ----------
+        message
+            Request ADU returned by `Xcom485i.prepare_read_info`
+
+        Returns
+        -------
+        float
+            User info read
+        """
+        return self._execute(message, _parse_float)
+
+    def read_info_group(self, group_id, address, member_count):
+        """
+        Read the same user info from the first devices of a group, as floats.
+
+        Note
+        -----
+        A *Modbus RTU* request gets a single response and *uModbus* parses one response per request, so a read sent
+        to a multicast address cannot be split per device. Each member is read on its unicast address, i.e.
+        `group_id + 1` to `group_id + member_count`, over the same serial port.
+
+        Parameters
+        ----------
+        group_id
+            Multicast address of the group, one of `xt_group_device_id`, `vt_group_device_id`, `vs_group_device_id`
+            or `bsp_group_device_id`
+        address
+            Register starting address, see *Studer Modbus RTU Appendix* for the complete list of accessible
+            register per device
+        member_count
+            Number of devices to read, up to 9 *Xtender*, 15 *VarioTrack*, 15 *VarioString* or 1 *BSP*
+
+        Returns
+        -------
+        list
+            User info read for each device, None for a device that did not answer
+
+        Raises
+        ------
+        ValueError
+            When `group_id` is not one of the groups above, the phase groups like `xt_l1_group_device_id` have no
+            consecutive unicast addresses, or when `member_count` exceeds the size of the group
+
+        Example
+        --------
+        .. code-block:: python
+
+            # read the battery temperature of the nine Xtender
+            read_values = xcom485i.read_info_group(xcom485i.addresses.xt_group_device_id, 2, 9)
+        """
+        max_count = self._group_sizes.get(group_id)
+        if max_count is None:
+            raise ValueError('%d is not the multicast address of an Xtender, VarioTrack, VarioString or BSP group.'
+                             % group_id)
+        if not 1 <= member_count <= max_count:
+            raise ValueError('Member count of group %d must be a value between 1 and %d.' % (group_id, max_count))
+        return [self.read_info(group_id + index, address) for index in range(1, member_count + 1)]
+
+    def _read_floats(self, function_code, slave_id, addresses):
+        """
+        Read floats with as few requests as possible, using the holding (3) or input (4) registers function code
+        """
+        values = dict.fromkeys(addresses)
+        for address, count in _float_runs(sorted(values), MAX_FLOATS_PER_READ):
+            message = _build_read(slave_id, function_code, address, 2 * count)
+            response = self._execute(message, lambda response: unpack_from('>%df' % count, response, 3))
+            if response is not None:
+                values.update(zip(range(address, address + 2 * count, 2), response))
+        return values
 
     def read_input_registers(self, slave_id, address, quantity):
         """
@@ -459,19 +945,8 @@ class Xcom485i:
         bytes
             Raw data from targeted registers
         """
-        message = rtu.read_input_registers(slave_id=slave_id, starting_address=address, quantity=quantity)
-        logger.debug("-> Transmit ADU : 0x%s", str(bytes(message).hex()))
-        try:
-            response = rtu.send_message(message, self.serial_port)
-        except (ValueError, KeyError) as e:
-            logger.error(
-                "--> Please match your configurations and the values set with the dip-switches on the device: ", e)
-        except ModbusError as e:
-            logger.error("--> Modbus error : ", e)
-        else:
-            hex_response = ' '.join(hex(x) for x in response)
-            logger.debug("<- Receive data : %s", str(hex_response))
-            return response
+        message = _build_read(slave_id, READ_INPUT_REGISTERS, address, quantity)
+        return self._execute(message, lambda response: list(unpack_from('>%dH' % quantity, response, 3)))
 
     def pending_message_count(self):
         """
@@ -493,7 +968,9 @@ class Xcom485i:
         --------
         Xcom485i.message_registers
         """
-        return self.read_input_registers(self.addresses.gateway_device_id, 0, 1)[0]
+        response = self._read_prepared(self._pending_count_adu, _H)
+        if response is not None:
+            return response[0]
 
     def message_registers(self):
         """
@@ -515,6 +992,38 @@ class Xcom485i:
         bytes
             Content of Input Register 0, 1, 2, 3
 
+        See also
+        --------
+        Xcom485i.message_registers_bulk
+        """
+        response = self._read_prepared(self._message_registers_adu, _4H)
+        if response is not None:
+            return list(response)
+
+    def message_registers_bulk(self, count):
+        """
+        Read several pending messages stored into the gateway, packing up to `MAX_MESSAGES_PER_READ` messages per
+        request.
+
+        Note
+        -----
+        Messages are requested as consecutive blocks of 4 input registers starting at 0x0001, the content of each block
+        is described in `Xcom485i.message_registers`. When the gateway refuses such a longer read with an exception
+        response, messages are read one by one for the lifetime of this instance, a timeout or a corrupted response
+        only stops the current read. When the response ends with all-zero blocks because the gateway holds fewer
+        messages than requested, these blocks are dropped and the messages still pending are read one by one.
+
+        Parameters
+        ----------
+        count
+            Number of messages to read, as returned by `Xcom485i.pending_message_count`, nothing is read when it is 0
+            or None because the count could not be read
+
+        Returns
+        -------
+        list
+            Content of Input Register 0, 1, 2, 3 for each message read, stops early on a failed read
+
         Example
         --------
         .. code-block:: python
@@ -523,8 +1032,10 @@ class Xcom485i:
             # Run this example within the 'examples/' folder using 'python ex_read_messages.py' from a CLI
             #   after installing xcom485i package with 'pip install xcom485i'
 
+            import sys
             import serial
             from xcom485i.client import Xcom485i
+            from _port import get_port
 
             SERIAL_PORT_NAME = 'COM4'  # your serial port interface name
             SERIAL_PORT_BAUDRATE = 9600  # baudrate used by your serial interface
@@ -532,22 +1043,82 @@ class Xcom485i:
 
             if __name__ == "__main__":
                 try:
-                    serial_port = serial.Serial(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE,
-                                                parity=serial.PARITY_EVEN, timeout=1)
+                    serial_port = get_port(SERIAL_PORT_NAME, SERIAL_PORT_BAUDRATE)
                 except serial.serialutil.SerialException as e:
                     print("Check your serial configuration : ", e)
-                else:
-                    xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=True)
-                    # always check the number of pending messages
-                    pending_message_count = xcom485i.pending_message_count()
-                    print('pending_message_count:', pending_message_count)
-
-                    for _ in range(pending_message_count):
-                        message_registers = xcom485i.message_registers()
-                        print('Message N°:', _)
-                        print("\t device source: ", message_registers[0])
-                        print("\t message id: ", message_registers[1])
-                        print("\t optionnal most significant word: ", message_registers[2])
-                        print("\t optionnal least significant word: ", message_registers[3])
-        """
-        return self.read_input_registers(self.addresses.gateway_device_id, 1, 4)
+                    sys.exit(1)
+
+                xcom485i = Xcom485i(serial_port, DIP_SWITCHES_ADDRESS_OFFSET, debug=False)
+                # always check the number of pending messages
+                pending_message_count = xcom485i.pending_message_count()
+                print('pending_message_count:', pending_message_count)
+
+                for index, message_registers in enumerate(
+                        xcom485i.message_registers_bulk(pending_message_count)):
+                    print('Message N°:', index)
+                    print("\t device source: ", message_registers[0])
+                    print("\t message id: ", message_registers[1])
+                    print("\t optionnal most significant word: ", message_registers[2])
+                    print("\t optionnal least significant word: ", message_registers[3])
+        """
+        messages = []
+        if not count:
+            return messages
+        bulk = self._bulk_messages_supported
+        while len(messages) < count:
+            frame_count = min(count - len(messages), MAX_MESSAGES_PER_READ)
+            response = False
+            if frame_count > 1 and bulk:
+                message = _build_read(self.addresses.gateway_device_id, READ_INPUT_REGISTERS, 1, 4 * frame_count)
+                response = self._execute_bulk(message, _parse_messages)
+                bulk = self._bulk_messages_supported
+                if isinstance(response, list) and len(response) < frame_count:
+                    # zero-padded tail, the gateway holds fewer messages than expected, the pending ones are read
+                    # one by one
+                    bulk = False
+                    read_count = len(messages) + len(response)
+                    count = read_count + min(self.pending_message_count() or 0, count - read_count)
+            if response is False:
+                registers = self.message_registers()
+                response = None if registers is None else [registers]
+            if response is None:
+                break
+            messages.extend(response)
+        return messages
+
+    def drain_messages(self):
+        """
+        Read all pending messages stored into the gateway.
+
+        Note
+        -----
+        The number of pending messages and the first message are read with a single request of the input registers
+        0x0000 to 0x0004, the remaining messages are then read with `Xcom485i.message_registers_bulk`. When the
+        gateway refuses the longer read, `Xcom485i.pending_message_count` is read on its own first. All-zero message
+        registers padding a response are never returned as messages.
+
+        Returns
+        -------
+        list
+            Content of Input Register 0, 1, 2, 3 for each message read, see `Xcom485i.message_registers`
+
+        See also
+        --------
+        Xcom485i.message_registers_bulk
+        """
+        response = False
+        if self._bulk_messages_supported:
+            response = self._execute_bulk(self._drain_adu, lambda response: _5H.unpack_from(response, 3),
+                                          5 + _5H.size)
+            if response is None:
+                return []
+        if response is False:
+            count = self.pending_message_count()
+            return self.message_registers_bulk(count) if count else []
+        count, *first = response
+        if not count:
+            return []
+        if not any(first):
+            # zero-padded message, the first message is read again with the remaining ones
+            return self.message_registers_bulk(count)
+        return [first] + self.message_registers_bulk(count - 1)